@@ -31,7 +31,7 @@ Features:
 - High Score Table: Saves and displays the top 10 scores.
 
 Code Structure:
-- Imports: Standard modules like random, csv, datetime, etc.
+- Imports: Standard modules like random, csv, time, etc.
 - Configurations: Configurable constants and messages.
 - Utility Functions: For loading words and initializing lists.
 - Game Logic: Evaluates guesses and provides feedback.
@@ -47,11 +47,18 @@ Code Structure:
 
 import random
 import csv
-from datetime import datetime
 import os
 import time
 import sys
 from pathlib import Path
+from functools import lru_cache, partial
+from collections import Counter
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import hashlib
+import struct
+import re
 
 # ==========================
 # CONSTANTS AND CONFIGURATION
@@ -60,6 +67,12 @@ from pathlib import Path
 # Testing configuration
 RUN_TESTS = False
 
+# History configuration - keep each game's guesses for analytics features
+TRACK_HISTORY = False
+
+# Word loading configuration - strict mode reports every invalid line in the word files
+STRICT_WORD_LOADING = False
+
 # Core game constants
 MAX_ATTEMPTS = 6
 SECRET_WORD_LENGTH = 5
@@ -70,7 +83,8 @@ MAX_ALLOWED_TIME = 3600  # seconds (1 hour)
 FILES_CONFIG = {
     'high_scores': 'high_scores.csv',  # High scores storage file
     'target_words': 'target_words.txt',  # Words that can be chosen as secret words
-    'valid_words': 'all_words.txt'  # All valid words for guessing
+    'valid_words': 'all_words.txt',  # All valid words for guessing
+    'patterns': 'patterns.bin'  # Precomputed guess/target pattern matrix (solver mode)
 }
 
 # Game configuration - centralized game settings
@@ -82,6 +96,11 @@ GAME_CONFIG = {
     'base_score': 3600  # Base score before time penalty
 }
 
+# Feedback scores returned by evaluate_guess for each letter
+SCORE_NOT_IN_WORD = 0
+SCORE_WRONG_POSITION = 1
+SCORE_CORRECT = 2
+
 # Feedback symbols configuration - easy to customize visual feedback
 FEEDBACK_SYMBOLS = {
     'correct': "\u2713",  # ✓ - Correct letter in correct position
@@ -89,6 +108,16 @@ FEEDBACK_SYMBOLS = {
     'not_in_word': "-"  # - - Letter not in the word
 }
 
+# Feedback symbols indexed by feedback score (SCORE_NOT_IN_WORD, SCORE_WRONG_POSITION, SCORE_CORRECT)
+_SYMBOL_BY_SCORE = (
+    FEEDBACK_SYMBOLS['not_in_word'],
+    FEEDBACK_SYMBOLS['wrong_position'],
+    FEEDBACK_SYMBOLS['correct']
+)
+
+# Feedback output template - attempt line, letters row, symbols row, blank line
+_FEEDBACK_TEMPLATE = "Attempt %d/%d\n%s\n%s\n\n"
+
 # System messages configuration - centralized for easy localization
 MESSAGES = {
     'welcome': "Enter your name: ",
@@ -109,11 +138,44 @@ MESSAGES = {
     'unexpected_error': "Unexpected error occurred. Please try again."
 }
 
+# Precompiled guess format check - exactly word_length ASCII letters, any case.
+# Same alphabet as is_playable_word, so every loaded word can pass it
+_GUESS_PATTERN = re.compile(f"[a-zA-Z]{{{SECRET_WORD_LENGTH}}}")
+
+# Accepted answers to the play again prompt
+_YES_ANSWERS = frozenset(['yes', 'y', 'si', 's'])
+_NO_ANSWERS = frozenset(['no', 'n'])
+
+# Dedicated random number generator for choosing secret words,
+# seeded when running tests so the chosen words are reproducible
+_RNG = random.Random(0 if RUN_TESTS else None)
+
 
 # ==========================
 # UTILITY FUNCTIONS
 # ==========================
 
+def is_playable_word(word):
+    """
+    Check that a word uses the game's alphabet and has the right length.
+
+    Args:
+        word (str): Lowercase word to check
+
+    Returns:
+        bool: True if the word has word_length ASCII letters a-z
+
+    Features:
+        - Shared by both word loaders so every loaded word can be scored
+        - Accented letters are rejected, the scorer only counts a-z
+
+    Examples:
+        >>> is_playable_word('crane'), is_playable_word('héllo'), is_playable_word('cran3')
+        (True, False, False)
+    """
+    return len(word) == GAME_CONFIG['word_length'] and word.isascii() and word.isalpha()
+
+
 def load_words(file_path):
     """
     Load words from a text file with comprehensive error handling.
@@ -126,9 +188,10 @@ def load_words(file_path):
 
     Features:
         - Validates file existence and permissions
-        - Filters words by length and alphabetic characters
+        - Filters words by length and ASCII letters a-z (see is_playable_word)
         - Provides detailed error messages for debugging
         - Handles encoding issues gracefully
+        - Validates all lines in bulk, only rescanning to report invalid ones
     """
     try:
         file_path = Path(file_path)
@@ -139,30 +202,30 @@ def load_words(file_path):
             print("Make sure the file exists in the current directory.")
             return []
 
-        words = []
-
-        # Open file with proper encoding
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, raw_line in enumerate(file, 1):
-                try:
-                    cleaned_word = raw_line.strip().lower()
-
-                    # Skip empty lines
-                    if cleaned_word:
-                        # Validate word length
-                        if len(cleaned_word) == GAME_CONFIG['word_length']:
-                            # Validate alphabetic characters only
-                            if cleaned_word.isalpha():
-                                words.append(cleaned_word)
-                            else:
-                                print(
-                                    f"Warning: Invalid word at line {line_num}: '{cleaned_word}' (contains non-alphabetic characters)")
-                        else:
-                            print(f"Warning: Word ignored at line {line_num}: '{cleaned_word}' (incorrect length)")
-
-                except Exception as e:
-                    print(f"Error processing line {line_num}: {e}")
+        # Read the whole file at once with proper encoding
+        cleaned_words = [raw_line.strip().lower()
+                         for raw_line in file_path.read_text(encoding='utf-8').splitlines()]
+
+        # Keep words with the right length and ASCII letters only
+        words = [cleaned_word for cleaned_word in cleaned_words if is_playable_word(cleaned_word)]
+
+        # Only walk the lines again to report problems if some were rejected
+        if len(words) != len(cleaned_words) - cleaned_words.count(''):
+            for line_num, cleaned_word in enumerate(cleaned_words, 1):
+                # Skip empty lines
+                if not cleaned_word:
                     continue
+                # Validate word length
+                if len(cleaned_word) != GAME_CONFIG['word_length']:
+                    print(f"Warning: Word ignored at line {line_num}: '{cleaned_word}' (incorrect length)")
+                # Validate alphabetic characters only
+                elif not cleaned_word.isalpha():
+                    print(
+                        f"Warning: Invalid word at line {line_num}: '{cleaned_word}' (contains non-alphabetic characters)")
+                # Validate letters are in the a-z alphabet the scorer uses
+                elif not cleaned_word.isascii():
+                    print(
+                        f"Warning: Invalid word at line {line_num}: '{cleaned_word}' (contains non-ASCII letters)")
 
         # Final validation
         if not words:
@@ -180,69 +243,265 @@ def load_words(file_path):
         return []
 
 
-def initialize_feedback_list():
+def load_valid_words_fast(file_path):
     """
-    Initialize feedback list with zeros.
+    Load the set of valid guess words with a single file read.
+
+    Args:
+        file_path (str): Path to the file containing words
 
     Returns:
-        list: List of zeros with length equal to word length
+        frozenset: Set of valid words, empty set if file cannot be loaded
+
+    Features:
+        - Reads the whole file at once instead of line by line
+        - Silently skips words with the wrong length or non-ASCII-letter characters
+        - Use load_words instead (STRICT_WORD_LOADING) for per-line warnings
     """
-    return [0] * GAME_CONFIG['word_length']
+    try:
+        text = Path(file_path).read_text(encoding='utf-8').lower()
+    except FileNotFoundError:
+        print(f"Error: File not found: {file_path}")
+        return frozenset()
+    except Exception as e:
+        print(f"Unexpected error loading {file_path}: {e}")
+        return frozenset()
 
+    return frozenset(word for word in text.split() if is_playable_word(word))
 
-def initialize_secret_usage_list():
+
+@lru_cache(maxsize=None)
+def load_game_words():
     """
-    Initialize usage tracking list for secret word letters.
+    Load the target and valid guess word lists once per session.
 
     Returns:
-        list: List of False values with length equal to word length
+        tuple: (candidate_secret_words, valid_guess_words) where:
+               - candidate_secret_words (tuple): Words that can be the secret word
+               - valid_guess_words (frozenset): Words the player is allowed to guess
+
+    Features:
+        - Cached, so playing again reuses the lists instead of re-reading the files
+        - Uses the verbose load_words for valid guesses when STRICT_WORD_LOADING is set
+    """
+    candidate_secret_words = tuple(load_words(FILES_CONFIG['target_words']))
+
+    if STRICT_WORD_LOADING:
+        valid_guess_words = frozenset(load_words(FILES_CONFIG['valid_words']))
+    else:
+        valid_guess_words = load_valid_words_fast(FILES_CONFIG['valid_words'])
+
+    return candidate_secret_words, valid_guess_words
+
+
+def make_secret_table(secret_word):
     """
-    return [False] * GAME_CONFIG['word_length']
+    Precompute the letter-count table for a secret word.
+
+    The secret word stays the same for the whole game, so this is built
+    once per game and reused for every guess.
+
+    Args:
+        secret_word (str): The secret word to guess
+
+    Returns:
+        tuple: (secret_bytes, letter_counts) where:
+               - secret_bytes (bytes): ASCII encoding of the secret word
+               - letter_counts (bytearray): Count of each letter a-z (length 26)
+    """
+    secret_bytes = secret_word.encode('ascii')
+    letter_counts = bytearray(26)
+
+    for letter_code in secret_bytes:
+        letter_counts[letter_code - 97] += 1
+
+    return secret_bytes, letter_counts
 
 
 # ==========================
 # CORE GAME LOGIC
 # ==========================
 
-def evaluate_guess(guessed_word, secret_word):
+def score_encoded_guess(guess_bytes, secret_bytes, secret_counts, feedback_buffer):
+    """
+    Score an encoded guess into a feedback buffer and return its packed pattern.
+
+    This is the single scoring implementation: evaluate_guess wraps it for
+    strings, and the bulk solver functions call it directly on pre-encoded
+    words with one reused buffer.
+
+    Args:
+        guess_bytes (bytes): ASCII encoding of the guessed word
+        secret_bytes (bytes): ASCII encoding of the secret word
+        secret_counts (bytearray): Letter counts from make_secret_table
+        feedback_buffer (bytearray): Buffer of word length, overwritten with the scores
+
+    Returns:
+        int: Packed pattern number (see pack_feedback) of the scores written
+
+    Algorithm:
+        1. First pass: Mark exact matches (green) and use up their letters
+        2. Second pass: Mark letters in wrong positions (yellow) while
+           the secret still has unused copies of that letter, packing
+           each score into the pattern as it goes
+        3. Uses a per-letter count table to handle duplicate letters correctly
+    """
+    letter_counts = secret_counts[:]  # Copy so the table can be reused
+
+    # First pass: Find exact matches and use up their letters
+    for position, guess_code in enumerate(guess_bytes):
+        if guess_code == secret_bytes[position]:
+            feedback_buffer[position] = SCORE_CORRECT
+            letter_counts[guess_code - 97] -= 1
+        else:
+            feedback_buffer[position] = SCORE_NOT_IN_WORD
+
+    # Second pass: Find letters in wrong positions and pack every score
+    pattern = 0
+    for position, guess_code in enumerate(guess_bytes):
+        score = feedback_buffer[position]
+        if not score:
+            letter_index = guess_code - 97
+            if letter_counts[letter_index] > 0:
+                score = SCORE_WRONG_POSITION
+                feedback_buffer[position] = score
+                letter_counts[letter_index] -= 1
+        pattern = pattern * 3 + score
+
+    return pattern
+
+
+def evaluate_guess(guessed_word, secret_word, secret_table=None):
     """
     Evaluate a guess against the secret word using Wordle rules.
 
     Args:
         guessed_word (str): The word guessed by the player
         secret_word (str): The secret word to guess
+        secret_table (tuple): Optional table from make_secret_table(secret_word),
+                              built on the fly if not given
 
     Returns:
-        list: Feedback scores where:
-              2 = correct letter in correct position
-              1 = correct letter in wrong position
-              0 = letter not in word
+        tuple: Feedback scores where:
+               2 = correct letter in correct position (SCORE_CORRECT)
+               1 = correct letter in wrong position (SCORE_WRONG_POSITION)
+               0 = letter not in word (SCORE_NOT_IN_WORD)
 
     Algorithm:
-        1. First pass: Mark exact matches (green)
-        2. Second pass: Mark letters in wrong positions (yellow)
-        3. Uses letter tracking to handle duplicate letters correctly
-    """
-    feedback_scores = initialize_feedback_list()
-    letter_usage_flags = initialize_secret_usage_list()
-
-    # First pass: Find exact matches (correct position)
-    for position in range(GAME_CONFIG['word_length']):
-        if guessed_word[position] == secret_word[position]:
-            feedback_scores[position] = 2  # Correct position
-            letter_usage_flags[position] = True  # Mark as used
-
-    # Second pass: Find letters in wrong positions
-    for guess_position in range(GAME_CONFIG['word_length']):
-        if feedback_scores[guess_position] == 0:  # Not already marked as correct
-            for secret_position in range(GAME_CONFIG['word_length']):
-                if (guessed_word[guess_position] == secret_word[secret_position] and
-                        not letter_usage_flags[secret_position]):
-                    feedback_scores[guess_position] = 1  # Wrong position
-                    letter_usage_flags[secret_position] = True  # Mark as used
-                    break
+        Two-pass scoring with a per-letter count table (see score_encoded_guess)
+
+    Examples:
+        >>> evaluate_guess('speed', 'abide')
+        (0, 0, 1, 0, 1)
+        >>> evaluate_guess('eerie', 'there')
+        (1, 0, 1, 0, 2)
+        >>> evaluate_guess('crane', 'crane')
+        (2, 2, 2, 2, 2)
+    """
+    # Winning guess: every letter is correct, no need to score
+    if guessed_word == secret_word:
+        return (SCORE_CORRECT,) * GAME_CONFIG['word_length']
+
+    if secret_table is None:
+        secret_table = make_secret_table(secret_word)
+
+    secret_bytes, secret_counts = secret_table
+    feedback_buffer = bytearray(GAME_CONFIG['word_length'])
+    score_encoded_guess(guessed_word.encode('ascii'), secret_bytes, secret_counts, feedback_buffer)
+
+    return tuple(feedback_buffer)
+
+
+def evaluate_guesses(guessed_words, secret_word):
+    """
+    Evaluate many guesses against the same secret word.
+
+    Args:
+        guessed_words (iterable): Words to score against the secret word
+        secret_word (str): The secret word to guess
+
+    Returns:
+        list: One feedback tuple (see evaluate_guess) per guessed word
+
+    Features:
+        - Builds the secret letter-count table only once for the whole batch
+        - Intended for solver or statistics tools scoring a full word list
 
-    return feedback_scores
+    Examples:
+        >>> evaluate_guesses(['crane', 'there'], 'there')
+        [(0, 1, 0, 0, 2), (2, 2, 2, 2, 2)]
+    """
+    secret_table = make_secret_table(secret_word)
+    return [evaluate_guess(guessed_word, secret_word, secret_table)
+            for guessed_word in guessed_words]
+
+
+def pack_feedback(feedback_scores):
+    """
+    Pack feedback scores into a single base-3 pattern number.
+
+    Args:
+        feedback_scores (tuple): Feedback scores from evaluate_guess
+
+    Returns:
+        int: Pattern number (0-242 for 5-letter words), small enough to store in one byte
+
+    Examples:
+        >>> pack_feedback((0, 0, 1, 0, 1))
+        10
+        >>> pack_feedback((2, 2, 2, 2, 2))
+        242
+    """
+    pattern = 0
+    for score in feedback_scores:
+        pattern = pattern * 3 + score
+    return pattern
+
+
+def unpack_feedback(pattern):
+    """
+    Unpack a base-3 pattern number back into feedback scores.
+
+    Args:
+        pattern (int): Pattern number from pack_feedback
+
+    Returns:
+        tuple: Feedback scores in the same format as evaluate_guess
+
+    Examples:
+        >>> unpack_feedback(10)
+        (0, 0, 1, 0, 1)
+        >>> all(pack_feedback(unpack_feedback(pattern)) == pattern for pattern in range(243))
+        True
+    """
+    feedback_scores = [SCORE_NOT_IN_WORD] * GAME_CONFIG['word_length']
+    for position in range(GAME_CONFIG['word_length'] - 1, -1, -1):
+        pattern, feedback_scores[position] = divmod(pattern, 3)
+    return tuple(feedback_scores)
+
+
+@lru_cache(maxsize=1 << 16)
+def feedback_pattern(guessed_word, secret_word):
+    """
+    Return the packed feedback pattern for a guess, memoized per word pair.
+
+    Args:
+        guessed_word (str): The word guessed
+        secret_word (str): The secret word to guess
+
+    Returns:
+        int: Packed pattern number (see pack_feedback)
+
+    Features:
+        - Repeated scoring of a recently seen word pair is a single cache lookup
+        - Cache is bounded (65536 pairs), so memory use stays small
+        - For every (guess, target) pair use load_pattern_matrix instead
+
+    Examples:
+        >>> unpack_feedback(feedback_pattern('speed', 'abide'))
+        (0, 0, 1, 0, 1)
+    """
+    return pack_feedback(evaluate_guess(guessed_word, secret_word))
 
 
 def display_guess_feedback(guessed_word, feedback_scores, attempt_number):
@@ -251,7 +510,7 @@ def display_guess_feedback(guessed_word, feedback_scores, attempt_number):
 
     Args:
         guessed_word (str): The word that was guessed
-        feedback_scores (list): List of feedback scores from evaluate_guess
+        feedback_scores (tuple): Feedback scores from evaluate_guess
         attempt_number (int): Current attempt number
 
     Output format:
@@ -259,24 +518,372 @@ def display_guess_feedback(guessed_word, feedback_scores, attempt_number):
         A B C D E  (guessed letters in uppercase)
         ✓ ? - - ?  (feedback symbols)
     """
-    print(f"Attempt {attempt_number}/{GAME_CONFIG['max_attempts']}")
+    # Guessed letters in uppercase, then feedback symbols
+    letters_row = " ".join(guessed_word.upper())
+    symbols_row = " ".join(_SYMBOL_BY_SCORE[score] for score in feedback_scores)
+
+    # Write all three lines at once
+    sys.stdout.write(_FEEDBACK_TEMPLATE % (attempt_number, GAME_CONFIG['max_attempts'], letters_row, symbols_row))
+
+
+# ==========================
+# SOLVER SUPPORT
+# ==========================
+
+def encode_words(words):
+    """
+    Encode a word list once for the bulk scoring functions.
+
+    Args:
+        words (iterable): Lowercase words to encode
+
+    Returns:
+        list: ASCII bytes for each word, in the same order as words
+    """
+    return [word.encode('ascii') for word in words]
+
+
+def score_encoded_patterns(encoded_guesses, secret_word, letter_masks=None):
+    """
+    Score a whole encoded guess list against one secret word as packed patterns.
+
+    Args:
+        encoded_guesses (list): Guesses from encode_words
+        secret_word (str): The secret word to guess
+        letter_masks (list): Optional masks from build_letter_masks for the same guesses
+
+    Returns:
+        bytes: One packed pattern number (see pack_feedback) per guess
+
+    Features:
+        - Scores and packs in one fused pass per guess
+        - With letter masks, guesses sharing no letter with the secret skip scoring (pattern 0)
+
+    Examples:
+        >>> guesses = ['speed', 'crane', 'moult']
+        >>> list(score_encoded_patterns(encode_words(guesses), 'abide'))
+        [10, 11, 0]
+        >>> list(score_encoded_patterns(encode_words(guesses), 'abide')) == [
+        ...     feedback_pattern(guess, 'abide') for guess in guesses]
+        True
+        >>> score_encoded_patterns(encode_words(guesses), 'abide', build_letter_masks(guesses)) == (
+        ...     score_encoded_patterns(encode_words(guesses), 'abide'))
+        True
+    """
+    secret_bytes, secret_counts = make_secret_table(secret_word)
+    feedback_buffer = bytearray(GAME_CONFIG['word_length'])
+
+    if letter_masks is None:
+        return bytes(score_encoded_guess(guess_bytes, secret_bytes, secret_counts, feedback_buffer)
+                     for guess_bytes in encoded_guesses)
+
+    secret_mask = word_letter_mask(secret_word)
+
+    return bytes(score_encoded_guess(guess_bytes, secret_bytes, secret_counts, feedback_buffer)
+                 if guess_mask & secret_mask else 0
+                 for guess_bytes, guess_mask in zip(encoded_guesses, letter_masks))
+
+
+def build_pattern_matrix(guess_words, target_words, workers=1):
+    """
+    Build the packed feedback pattern for every (guess, target) pair.
+
+    Args:
+        guess_words (list): Words that can be guessed (N words)
+        target_words (list): Words that can be the secret word (M words)
+        workers (int): Number of processes scoring target columns in parallel
+
+    Returns:
+        bytearray: N x M matrix stored row by row, one byte per pattern.
+                   The pattern for guess i and target j is at index i * M + j.
+
+    Features:
+        - Encodes the guess list and its letter masks once
+        - Scores each target against the whole guess list in one fused batch
+        - Spreads target columns over several processes when workers > 1
+        - Writes each target's column straight into the matrix
+
+    Examples:
+        >>> guesses, targets = ['speed', 'crane', 'moult'], ['abide', 'crate']
+        >>> list(build_pattern_matrix(guesses, targets))
+        [10, 9, 11, 236, 0, 1]
+        >>> build_pattern_matrix(guesses, targets) == build_pattern_matrix(guesses, targets, workers=2)
+        True
+    """
+    target_count = len(target_words)
+    pattern_matrix = bytearray(len(guess_words) * target_count)
+    encoded_guesses = encode_words(guess_words)
+    guess_masks = build_letter_masks(guess_words)
+    score_column = partial(score_encoded_patterns, encoded_guesses, letter_masks=guess_masks)
+
+    if workers > 1 and target_count > 1:
+        # Large chunks so the shared guess list is sent to the workers only a few times
+        chunk_size = -(-target_count // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            columns = executor.map(score_column, target_words, chunksize=chunk_size)
+            for target_index, column in enumerate(columns):
+                pattern_matrix[target_index::target_count] = column
+    else:
+        for target_index, target_word in enumerate(target_words):
+            pattern_matrix[target_index::target_count] = score_column(target_word)
+
+    return pattern_matrix
+
+
+def pattern_matrix_header(guess_words, target_words):
+    """
+    Build the header that identifies a saved pattern matrix.
+
+    Args:
+        guess_words (list): Words that can be guessed (N words)
+        target_words (list): Words that can be the secret word (M words)
+
+    Returns:
+        bytes: N and M followed by a SHA-256 hash of both word lists
+    """
+    word_lists_hash = hashlib.sha256()
+    word_lists_hash.update("\n".join(guess_words).encode('ascii'))
+    word_lists_hash.update(b"\0")
+    word_lists_hash.update("\n".join(target_words).encode('ascii'))
+
+    return struct.pack('<II', len(guess_words), len(target_words)) + word_lists_hash.digest()
+
+
+def load_pattern_matrix(guess_words, target_words, workers=1):
+    """
+    Load the pattern matrix from disk, building and saving it if needed.
+
+    Args:
+        guess_words (list): Words that can be guessed (N words)
+        target_words (list): Words that can be the secret word (M words)
+        workers (int): Number of processes used if the matrix has to be built
+
+    Returns:
+        bytes-like: N x M pattern matrix (see build_pattern_matrix)
+
+    Features:
+        - Memory-maps an existing matrix file so pages are read on demand
+        - Rebuilds the matrix if the file is missing, has the wrong size, or was
+          built for different word lists (checked against the file header)
+        - Saves a newly built matrix, with its header, for the next run
+        - Replaces the file atomically, so earlier returned matrices stay valid
+
+    Examples:
+        >>> import tempfile
+        >>> temporary_directory = tempfile.TemporaryDirectory()
+        >>> saved_patterns_file = FILES_CONFIG['patterns']
+        >>> FILES_CONFIG['patterns'] = os.path.join(temporary_directory.name, 'patterns.bin')
+        >>> guesses, targets = ['speed', 'crane', 'moult'], ['abide', 'crate']
+        >>> built = load_pattern_matrix(guesses, targets)
+        >>> reloaded = load_pattern_matrix(guesses, targets)
+        >>> type(reloaded).__name__, reloaded == built
+        ('memoryview', True)
+        >>> changed = load_pattern_matrix(guesses, targets[::-1])
+        >>> list(changed), reloaded == built
+        ([9, 10, 236, 11, 1, 0], True)
+        >>> FILES_CONFIG['patterns'] = saved_patterns_file
+        >>> reloaded.release()
+        >>> temporary_directory.cleanup()
+    """
+    patterns_file = Path(FILES_CONFIG['patterns'])
+    header = pattern_matrix_header(guess_words, target_words)
+    expected_size = len(header) + len(guess_words) * len(target_words)
+
+    try:
+        if patterns_file.exists() and patterns_file.stat().st_size == expected_size:
+            with open(patterns_file, 'rb') as file:
+                mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            # Only reuse the matrix if it was built for these word lists
+            if mapped_file[:len(header)] == header:
+                return memoryview(mapped_file)[len(header):]
+            mapped_file.close()
+    except Exception as e:
+        print(f"Error loading pattern matrix: {e}")
+
+    pattern_matrix = build_pattern_matrix(guess_words, target_words, workers)
+
+    # Write to a temporary file and swap it in, so matrices already mapped from
+    # the old file keep their data and a half-written file is never loaded
+    temporary_file = patterns_file.with_name(f"{patterns_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary_file, 'wb') as file:
+            file.write(header)
+            file.write(pattern_matrix)
+        os.replace(temporary_file, patterns_file)
+    except Exception as e:
+        print(f"Error saving pattern matrix: {e}")
+        temporary_file.unlink(missing_ok=True)
+
+    return pattern_matrix
+
+
+def word_letter_mask(word):
+    """
+    Encode the set of letters in a word as a 26-bit integer.
+
+    Args:
+        word (str): Lowercase word to encode
+
+    Returns:
+        int: Bit mask with bit 0 set for 'a', bit 1 for 'b', and so on
+
+    Examples:
+        >>> bin(word_letter_mask('abide'))
+        '0b100011011'
+    """
+    letter_mask = 0
+    for letter_code in word.encode('ascii'):
+        letter_mask |= 1 << (letter_code - 97)
+    return letter_mask
+
+
+def build_letter_masks(words):
+    """
+    Precompute the letter mask of every word in a list.
+
+    Args:
+        words (list): Words to encode
+
+    Returns:
+        list: Letter masks (see word_letter_mask), in the same order as words
+    """
+    return [word_letter_mask(word) for word in words]
+
+
+def filter_words_by_letters(words, letter_masks, required_mask=0, excluded_mask=0):
+    """
+    Keep the words that contain all required letters and no excluded letters.
+
+    Args:
+        words (list): Candidate words
+        letter_masks (list): Precomputed masks from build_letter_masks(words)
+        required_mask (int): Letters known to be in the secret word
+        excluded_mask (int): Letters known not to be in the secret word
+
+    Returns:
+        list: Words still possible, in their original order
+
+    Features:
+        - Each word is checked with two bitwise operations instead of a letter loop
+
+    Examples:
+        >>> words = ['crane', 'slate', 'moist', 'abide']
+        >>> masks = build_letter_masks(words)
+        >>> filter_words_by_letters(words, masks, word_letter_mask('ae'), word_letter_mask('s'))
+        ['crane', 'abide']
+    """
+    return [word for word, letter_mask in zip(words, letter_masks)
+            if letter_mask & required_mask == required_mask and not letter_mask & excluded_mask]
 
-    # Display guessed letters in uppercase
-    letters_output = [letter.upper() for letter in guessed_word]
-    symbols_output = []
 
-    # Convert numeric feedback to symbols
+def pack_word(word):
+    """
+    Pack a word into a single integer, one byte per letter.
+
+    Args:
+        word (str): Lowercase word to pack
+
+    Returns:
+        int: Packed word, first letter in the most significant byte
+
+    Examples:
+        >>> hex(pack_word('abide'))
+        '0x6162696465'
+    """
+    return int.from_bytes(word.encode('ascii'), 'big')
+
+
+def pack_words(words):
+    """
+    Pack every word in a list (see pack_word).
+
+    Args:
+        words (list): Words to pack
+
+    Returns:
+        list: Packed words, in the same order as words
+    """
+    return [pack_word(word) for word in words]
+
+
+def green_byte_mask(feedback_scores):
+    """
+    Build a byte mask covering the positions marked correct in a feedback.
+
+    Args:
+        feedback_scores (tuple): Feedback scores from evaluate_guess
+
+    Returns:
+        int: Mask with 0xFF in the byte of each correct position, matching pack_word
+
+    Examples:
+        >>> hex(green_byte_mask((2, 0, 1, 0, 2)))
+        '0xff000000ff'
+    """
+    byte_mask = 0
     for score in feedback_scores:
-        if score == 2:
-            symbols_output.append(FEEDBACK_SYMBOLS['correct'])
-        elif score == 1:
-            symbols_output.append(FEEDBACK_SYMBOLS['wrong_position'])
-        else:
-            symbols_output.append(FEEDBACK_SYMBOLS['not_in_word'])
+        byte_mask = (byte_mask << 8) | (0xFF if score == SCORE_CORRECT else 0)
+    return byte_mask
+
+
+def filter_words_by_greens(words, packed_words, packed_guess, byte_mask):
+    """
+    Keep the words that have the guess's letters at every correct position.
+
+    Args:
+        words (list): Candidate words
+        packed_words (list): Precomputed packed words from pack_words(words)
+        packed_guess (int): Packed guess from pack_word
+        byte_mask (int): Correct positions from green_byte_mask
 
-    # Print formatted output
-    print(" ".join(letters_output))
-    print(" ".join(symbols_output) + "\n")
+    Returns:
+        list: Words still possible, in their original order
+
+    Features:
+        - Compares all correct positions at once with one XOR and one AND per word
+
+    Examples:
+        >>> words = ['crate', 'crane', 'grace', 'trace']
+        >>> feedback_scores = evaluate_guess('crane', 'crate')
+        >>> filter_words_by_greens(words, pack_words(words), pack_word('crane'), green_byte_mask(feedback_scores))
+        ['crate', 'crane']
+    """
+    return [word for word, packed_word in zip(words, packed_words)
+            if not (packed_word ^ packed_guess) & byte_mask]
+
+
+def get_letter_frequency_scores(candidate_words):
+    """
+    Score every candidate word by how common its letters are.
+
+    Args:
+        candidate_words (tuple): Words to score, e.g. the candidate secret words
+                                 from load_game_words
+
+    Returns:
+        dict: Maps each candidate word to the summed share of candidate words
+              containing each of its distinct letters (higher = more common letters)
+
+    Features:
+        - Call once per word list and keep the dict, so each later lookup
+          is a single dict access instead of a scan of every word
+        - Counts each letter once per word so repeated letters are not rewarded
+        - Intended for hint or solver features ranking possible guesses
+
+    Examples:
+        >>> get_letter_frequency_scores(('crane', 'slate', 'moist'))['slate']
+        3.0
+    """
+    if not candidate_words:
+        return {}
+
+    # Number of candidate words containing each letter
+    letter_frequencies = Counter(letter for word in candidate_words for letter in set(word))
+    word_count = len(candidate_words)
+
+    return {word: sum(letter_frequencies[letter] for letter in set(word)) / word_count
+            for word in candidate_words}
 
 
 # ==========================
@@ -288,79 +895,142 @@ def load_high_scores():
     Load high scores from CSV file with error handling.
 
     Returns:
-        list: List of high score dictionaries, sorted by score (highest first)
+        list: List of (score, name, date) tuples, sorted by score (highest first)
               Limited to top 10 scores
 
     Features:
         - Handles missing or corrupted files gracefully
         - Validates data types (score must be integer)
-        - Provides warnings for invalid entries
+        - Skips invalid entries
         - Returns empty list if no valid scores found
+        - Only re-reads the file after it has changed on disk
     """
     high_scores_file = Path(FILES_CONFIG['high_scores'])
 
-    # Return empty list if file doesn't exist
-    if not high_scores_file.exists():
-        return []
-
     try:
-        high_scores = []
-
-        with open(high_scores_file, mode='r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 1):
-                try:
-                    # Validate and convert score to integer
-                    row['score'] = int(row['score'])
-                    high_scores.append(row)
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Error in high scores file at line {row_num}: {e}")
-                    continue
-
-        # Sort by score (highest first) and return top 10
-        return sorted(high_scores, key=lambda x: x['score'], reverse=True)[:10]
-
+        modified_time = high_scores_file.stat().st_mtime_ns
+        return _load_high_scores_cached(str(high_scores_file), modified_time)
+    except FileNotFoundError:
+        # Return empty list if file doesn't exist
+        return []
     except Exception as e:
+        # Errors are not cached, so the next call reads the file again
         print(f"Error loading high scores: {e}")
         return []
 
 
-def save_high_score(player_name, score):
+@lru_cache(maxsize=4)
+def _load_high_scores_cached(file_path, modified_time):
+    """
+    Parse the high scores file, memoized by path and modification time.
+
+    Args:
+        file_path (str): Path to the high scores CSV file
+        modified_time (int): File modification time in nanoseconds (cache key only)
+
+    Returns:
+        list: Top 10 (score, name, date) tuples, highest first
+
+    Raises:
+        OSError: If the file cannot be read (propagated so failures are not cached)
+    """
+    with open(file_path, mode='r', newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        next(reader, None)  # Skip header row
+
+        # Keep only well-formed rows with an integer score
+        high_scores = [(int(row[0]), row[1], row[2]) for row in reader
+                       if len(row) == 3 and row[0].isdecimal()]
+
+    # Return top 10 (highest first) without sorting the whole list;
+    # ties on score keep their file order
+    return heapq.nlargest(10, high_scores, key=lambda entry: entry[0])
+
+
+class HighScoreWriter:
+    """
+    Append high scores to the CSV file, keeping it open for a whole session.
+
+    Usage:
+        with HighScoreWriter() as high_score_writer:
+            high_score_writer.write(score, player_name, date)
+
+    Features:
+        - Opens the file once, on the first write, instead of once per score
+        - Writes the header only if the file is new
+        - Flushes after each score so the high score table is always up to date
+        - Clears the cached high scores so the new entry is shown
+    """
+
+    fieldnames = ['score', 'name', 'date']
+
+    def __init__(self, file_path=None):
+        self.file_path = Path(file_path or FILES_CONFIG['high_scores'])
+        self.file = None
+        self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def open(self):
+        """Open the file for appending and write the header if it is new."""
+        file_exists = self.file_path.exists()
+
+        self.file = open(self.file_path, mode='a', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+
+        # Write header if file is new
+        if not file_exists:
+            self.writer.writerow(self.fieldnames)
+
+    def write(self, score, player_name, date):
+        """Append one high score row, opening the file if needed."""
+        if self.file is None:
+            self.open()
+
+        self.writer.writerow((score, player_name, date))
+        self.file.flush()
+
+        # Make sure the next load sees the new entry
+        _load_high_scores_cached.cache_clear()
+
+    def close(self):
+        """Close the file if it was opened."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+
+def save_high_score(player_name, score, high_score_writer=None):
     """
     Save a new high score to the CSV file.
 
     Args:
         player_name (str): Name of the player
         score (int): Score achieved
+        high_score_writer (HighScoreWriter): Optional open writer for the
+                                             session, a one-off writer is used if not given
 
     Features:
         - Creates file with headers if it doesn't exist
         - Appends new score to existing file
         - Handles file permission and disk space errors
         - Uses current date for timestamp
+        - Clears the cached high scores so the new entry is shown
     """
-    fieldnames = ['score', 'name', 'date']
-    current_date = datetime.now().strftime('%Y-%m-%d')
-    high_scores_file = Path(FILES_CONFIG['high_scores'])
-
-    new_entry = {
-        'score': score,
-        'name': player_name,
-        'date': current_date
-    }
+    current_date = time.strftime('%Y-%m-%d')
 
     try:
-        file_exists = high_scores_file.exists()
-
-        with open(high_scores_file, mode='a', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-
-            # Write header if file is new
-            if not file_exists:
-                writer.writeheader()
-
-            writer.writerow(new_entry)
+        if high_score_writer is None:
+            with HighScoreWriter() as one_off_writer:
+                one_off_writer.write(score, player_name, current_date)
+        else:
+            high_score_writer.write(score, player_name, current_date)
 
     except Exception as e:
         print(f"Error saving high score: {e}")
@@ -379,13 +1049,7 @@ def display_high_scores():
     print("\nTop 10 High Scores")
     print("------------------")
 
-    high_scores_file = Path(FILES_CONFIG['high_scores'])
-
-    # Check if file exists and has content
-    if not high_scores_file.exists() or high_scores_file.stat().st_size == 0:
-        print("Be the first legend to set a high score!\n")
-        return
-
+    # A missing or empty file loads as an empty list (load_high_scores stats it once)
     high_scores = load_high_scores()
 
     # Check if any valid scores were loaded
@@ -393,17 +1057,48 @@ def display_high_scores():
         print("Be the first legend to set a high score!\n")
         return
 
-    # Display formatted high scores table
-    print(f"{'Rank':<5} {'Score':<7} {'Name':<15} {'Date'}")
-    for index, entry in enumerate(high_scores, start=1):
-        print(f"{index:<5} {entry['score']:<7} {entry['name'].upper():<15} {entry['date']}")
-    print()
+    # Build formatted high scores table rows, then display them at once
+    table_rows = [f"{'Rank':<5} {'Score':<7} {'Name':<15} {'Date'}"]
+    table_rows.extend(f"{index:<5} {score:<7} {name.upper():<15} {date}"
+                      for index, (score, name, date) in enumerate(high_scores, start=1))
+    print("\n".join(table_rows) + "\n")
 
 
 # ==========================
 # USER INTERFACE FUNCTIONS
 # ==========================
 
+def read_input(prompt):
+    """
+    Show a prompt and read one line of player input.
+
+    Args:
+        prompt (str): Text shown before reading the input
+
+    Returns:
+        str: The line entered, without the trailing newline
+
+    Raises:
+        EOFError: When input has ended, same as the built-in input()
+
+    Features:
+        - Uses input() on an interactive terminal to keep line editing
+        - Reads buffered stdin directly for piped or scripted input
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+
+    # readline() returns an empty string at end of input
+    if not line:
+        raise EOFError
+
+    return line.rstrip('\n')
+
+
 def greet_player():
     """
     Display welcome banner and get player name with validation.
@@ -432,7 +1127,7 @@ W W W O   O R  R   D   D  L      E       G   G   A   A  M   M  E
     # Get valid player name with comprehensive validation
     while True:
         try:
-            player_name = input(MESSAGES['welcome']).strip()
+            player_name = read_input(MESSAGES['welcome']).strip()
 
             # Check for empty name
             if not player_name:
@@ -484,7 +1179,7 @@ def get_valid_guess(valid_words):
     Get a valid guess from the player with comprehensive validation.
 
     Args:
-        valid_words (set): Set of valid words that can be guessed
+        valid_words (frozenset): Set of valid words that can be guessed, loaded once per session
 
     Returns:
         str: Valid guess word in lowercase
@@ -494,33 +1189,34 @@ def get_valid_guess(valid_words):
         - Validates word length, alphabetic characters, and word list inclusion
         - Provides specific error messages for each validation failure
         - Handles keyboard interrupts and EOF gracefully
-        - Strips whitespace and converts to lowercase
+        - Strips whitespace and converts to lowercase only once the format is valid
     """
     while True:
         try:
-            guess = input(MESSAGES['guess_prompt']).strip().lower()
+            raw_guess = read_input(MESSAGES['guess_prompt']).strip()
 
-            # Handle help command
-            if guess == MESSAGES['help_command']:
+            # Handle help command (length check first so most inputs skip lowercasing)
+            if len(raw_guess) == len(MESSAGES['help_command']) and raw_guess.lower() == MESSAGES['help_command']:
                 show_instructions()
                 continue
 
-            # Validate non-empty input
-            if not guess:
-                print(MESSAGES['enter_word'] + "\n")
-                continue
-
-            # Validate word length
-            if len(guess) != GAME_CONFIG['word_length']:
-                print(MESSAGES['word_length_error'] + "\n")
-                continue
-
-            # Validate alphabetic characters only
-            if not guess.isalpha():
-                print(MESSAGES['letters_only'] + "\n")
+            # Validate word length and letters in a single match, before lowercasing
+            if not _GUESS_PATTERN.fullmatch(raw_guess):
+                # Work out which check failed for a specific error message
+                if not raw_guess:
+                    print(MESSAGES['enter_word'] + "\n")
+                elif len(raw_guess) != GAME_CONFIG['word_length']:
+                    print(MESSAGES['word_length_error'] + "\n")
+                elif not raw_guess.isalpha():
+                    print(MESSAGES['letters_only'] + "\n")
+                else:
+                    # Non-ASCII letters: the loaders drop such words (is_playable_word),
+                    # so this word really is not in the allowed list
+                    print(MESSAGES['word_not_valid'] + "\n")
                 continue
 
             # Validate word is in allowed list
+            guess = raw_guess.lower()
             if guess not in valid_words:
                 print(MESSAGES['word_not_valid'] + "\n")
                 continue
@@ -576,13 +1272,14 @@ def calculate_score(start_time):
 # GAME FLOW FUNCTIONS
 # ==========================
 
-def handle_win(player_name, start_time):
+def handle_win(player_name, start_time, high_score_writer=None):
     """
     Handle winning scenario - calculate score, save if valid, show results.
 
     Args:
         player_name (str): Name of the winning player
         start_time (float): Game start time for score calculation
+        high_score_writer (HighScoreWriter): Optional open writer for the session
 
     Features:
         - Calculates and displays final score
@@ -597,7 +1294,7 @@ def handle_win(player_name, start_time):
     print(f"Final score: {final_score}\n")
 
     if score_valid:
-        save_high_score(player_name, final_score)
+        save_high_score(player_name, final_score, high_score_writer)
     else:
         print(MESSAGES['too_long'])
         print(f"{MESSAGES['try_again']}\n")
@@ -634,13 +1331,13 @@ def prompt_play_again():
     """
     while True:
         try:
-            answer = input(MESSAGES['play_again']).strip().lower()
+            answer = read_input(MESSAGES['play_again']).strip().lower()
 
             # Accept various forms of "yes"
-            if answer in ['yes', 'y', 'si', 's']:
+            if answer in _YES_ANSWERS:
                 return True
             # Accept various forms of "no"
-            elif answer in ['no', 'n']:
+            elif answer in _NO_ANSWERS:
                 print(MESSAGES['goodbye'])
                 return False
             else:
@@ -694,16 +1391,19 @@ def validate_game_files():
 # MAIN GAME FUNCTIONS
 # ==========================
 
-def play_one_game():
+def play_one_game(high_score_writer=None):
     """
     Play a single game of Wordle.
 
+    Args:
+        high_score_writer (HighScoreWriter): Optional open writer for the session
+
     Returns:
         bool: True if game completed successfully, False if setup failed
 
     Game flow:
         1. Validate required files exist
-        2. Load word lists
+        2. Load word lists (cached after the first game)
         3. Choose random secret word
         4. Greet player and show instructions
         5. Main game loop (up to MAX_ATTEMPTS guesses)
@@ -711,7 +1411,7 @@ def play_one_game():
 
     Features:
         - Comprehensive error handling for file operations
-        - Tracks game history for potential future features
+        - Tracks game history for potential future features (TRACK_HISTORY)
         - Time tracking for scoring system
         - Graceful handling of file loading failures
     """
@@ -719,9 +1419,8 @@ def play_one_game():
     if not validate_game_files():
         return False
 
-    # Load word lists with error handling
-    candidate_secret_words = load_words(FILES_CONFIG['target_words'])
-    valid_guess_words = set(load_words(FILES_CONFIG['valid_words']))
+    # Load word lists with error handling (only read from disk on the first game)
+    candidate_secret_words, valid_guess_words = load_game_words()
 
     # Ensure word lists loaded successfully
     if not candidate_secret_words or not valid_guess_words:
@@ -729,7 +1428,8 @@ def play_one_game():
         return False
 
     # Choose random secret word
-    chosen_secret_word = random.choice(candidate_secret_words)
+    chosen_secret_word = _RNG.choice(candidate_secret_words)
+    secret_table = make_secret_table(chosen_secret_word)
     score_history = []  # Track guesses for potential future features
 
     # Initialize game
@@ -737,22 +1437,27 @@ def play_one_game():
     number_of_attempts = 0
     start_time = time.time()
 
+    # Bind loop lookups once instead of on every attempt
+    max_attempts = GAME_CONFIG['max_attempts']
+    record_history = score_history.append
+
     # Main game loop
-    while number_of_attempts < GAME_CONFIG['max_attempts']:
+    while number_of_attempts < max_attempts:
         # Get valid guess from player
         player_guess = get_valid_guess(valid_guess_words)
         number_of_attempts += 1
 
         # Evaluate guess and provide feedback
-        guess_score = evaluate_guess(player_guess, chosen_secret_word)
+        guess_score = evaluate_guess(player_guess, chosen_secret_word, secret_table)
         display_guess_feedback(player_guess, guess_score, number_of_attempts)
 
-        # Store guess history
-        score_history.append((player_guess, guess_score))
+        # Store guess history (only when analytics needs it)
+        if TRACK_HISTORY:
+            record_history((player_guess, guess_score))
 
         # Check for win condition
         if player_guess == chosen_secret_word:
-            handle_win(player_name, start_time)
+            handle_win(player_name, start_time, high_score_writer)
             return True
 
     # Handle loss (ran out of attempts)
@@ -766,19 +1471,21 @@ def play_wordle():
 
     Features:
         - Supports multiple consecutive games
+        - Keeps the high scores file open for the whole session
         - Handles keyboard interrupts gracefully
         - Provides overall error handling for unexpected issues
         - Clean exit messages
     """
     try:
-        while True:
-            # Play one game
-            if not play_one_game():
-                break
-
-            # Ask if player wants to continue
-            if not prompt_play_again():
-                break
+        with HighScoreWriter() as high_score_writer:
+            while True:
+                # Play one game
+                if not play_one_game(high_score_writer):
+                    break
+
+                # Ask if player wants to continue
+                if not prompt_play_again():
+                    break
 
     except KeyboardInterrupt:
         print(MESSAGES['interrupted'])